@@ -1,18 +1,36 @@
+import io
 import tkinter as tk
 from tkinter import ttk, messagebox
 import numpy as np
 import matplotlib
 matplotlib.use("TkAgg")
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg, NavigationToolbar2Tk
+from matplotlib.collections import EllipseCollection, PatchCollection
+from matplotlib.patches import Rectangle
 import matplotlib.pyplot as plt
 
+try:
+    from numba import njit
+except ImportError:
+    # numba is optional: without it the helpers below run as plain Python.
+    def njit(*args, **kwargs):
+        if args and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
+# set True to dump the row summary to stdout on every plot
+_DEBUG = False
+
 ##########################
 # Utility / Parsing
 ##########################
 
+# precomputed so the conversion is a single multiply, not a divide
+_INV_TWO_PI = 1.0 / (2.0 * np.pi)
+
 def circumference_to_radius(circum_m):
     """Convert a column circumference to radius in meters."""
-    return float(circum_m) / (2.0 * np.pi)
+    return float(circum_m) * _INV_TWO_PI
 
 def parse_columns(txt):
     """
@@ -20,24 +38,51 @@ def parse_columns(txt):
     Format per line: label, x_center, y_center, circumference
     Example:
         C2, 5.95, 2.91, 1.23
-    Return list of (label, cx, cy, radius).
+    Return (labels, cx, cy, cr): a list of labels plus parallel float64
+    arrays, so downstream code can work on whole columns at once.
+    Parsing goes through np.genfromtxt so all lines are handled by the
+    C parser instead of a Python loop.
     """
-    lines = txt.strip().splitlines()
-    columns = []
-    for line in lines:
-        line = line.strip()
-        if not line:
-            continue
-        parts = [p.strip() for p in line.split(',')]
-        if len(parts) < 4:
-            raise ValueError(f"Invalid column line: '{line}'")
-        lbl, sx, sy, scirc = parts
-        cx = float(sx)
-        cy = float(sy)
-        c_circ = float(scirc)
-        cr = circumference_to_radius(c_circ)
-        columns.append((lbl, cx, cy, cr))
-    return columns
+    if not txt.strip():
+        return ([], np.empty(0), np.empty(0), np.empty(0))
+    n_lines = sum(1 for line in txt.splitlines() if line.strip())
+    try:
+        arr = np.atleast_1d(np.genfromtxt(io.StringIO(txt), delimiter=',',
+                                          dtype=None, encoding='utf-8',
+                                          autostrip=True, usemask=True))
+    except ValueError as e:
+        raise ValueError(f"Invalid columns text:\n{e}")
+    # genfromtxt quietly substitutes a default for blank fields; the mask
+    # flags them so a typo can't silently misplace a column
+    mask = np.ma.getmaskarray(arr)
+    if arr.dtype.names is not None:
+        missing = any(mask[name].any() for name in arr.dtype.names)
+    else:
+        missing = mask.any()
+    if missing:
+        raise ValueError("Invalid columns text: missing field")
+    arr = np.asarray(arr)
+    if arr.dtype.names is not None:
+        # usual case: string label + numeric fields -> structured array
+        if len(arr.dtype.names) < 4:
+            raise ValueError("Invalid columns text: "
+                             "need 'label, x, y, circumference' per line")
+        labels = [str(lbl) for lbl in arr['f0']]
+        cx, cy, circ = arr['f1'], arr['f2'], arr['f3']
+    else:
+        # all-numeric input (numeric labels) parses as a plain 2-D array;
+        # one-field lines come back 1-D and atleast_2d would transpose
+        # them into a single fabricated column -- catch the mismatch
+        arr = np.atleast_2d(arr)
+        if arr.shape[0] != n_lines or arr.shape[1] < 4:
+            raise ValueError("Invalid columns text: "
+                             "need 'label, x, y, circumference' per line")
+        labels = [str(lbl) for lbl in arr[:, 0]]
+        cx, cy, circ = arr[:, 1], arr[:, 2], arr[:, 3]
+    return (labels,
+            cx.astype(np.float64),
+            cy.astype(np.float64),
+            circ.astype(np.float64) * _INV_TWO_PI)
 
 def parse_forced_rows(txt):
     """
@@ -45,25 +90,64 @@ def parse_forced_rows(txt):
     Each line: row_index, row_height
     e.g. 3, 0.66
     Return dict {row_index: forced_height}.
+    Like parse_columns, parsing goes through np.genfromtxt.
     """
-    lines = txt.strip().splitlines()
-    out = {}
-    for line in lines:
-        line = line.strip()
-        if not line:
-            continue
-        parts = [p.strip() for p in line.split(',')]
-        if len(parts) < 2:
-            raise ValueError(f"Invalid forced row line: '{line}'")
-        i = int(parts[0])
-        h = float(parts[1])
-        out[i] = h
-    return out
+    if not txt.strip():
+        return {}
+    n_lines = sum(1 for line in txt.splitlines() if line.strip())
+    try:
+        arr = np.atleast_2d(np.genfromtxt(io.StringIO(txt), delimiter=',',
+                                          dtype=np.float64, autostrip=True))
+    except ValueError as e:
+        raise ValueError(f"Invalid forced rows text:\n{e}")
+    # single-field lines come back 1-D and atleast_2d would fold all the
+    # lines into one bogus (row_index, height) pair -- catch the mismatch
+    if arr.shape[0] != n_lines or arr.shape[1] < 2:
+        raise ValueError("Invalid forced rows text: "
+                         "need 'row_index, height' per line")
+    # genfromtxt fills missing fields with nan instead of raising
+    if np.isnan(arr).any():
+        raise ValueError("Invalid forced rows text: "
+                         "missing or non-numeric value")
+    if np.any(arr[:, 0] != np.floor(arr[:, 0])):
+        raise ValueError("Invalid forced rows text: "
+                         "row_index must be an integer")
+    return {int(i): float(h) for i, h in zip(arr[:, 0], arr[:, 1])}
 
 ###########################
 # Row-Building Logic
 ###########################
 
+@njit(cache=True)
+def _build_rows_impl(total_length, default_height, forced_idx, forced_h):
+    """
+    JIT-compiled core of build_rows. Forced heights come in as sorted
+    parallel arrays (numba can't take a dict). No per-row loop: the
+    heights are expanded into one table, a cumsum gives every row's end
+    edge, and a searchsorted finds where total_length is reached.
+    Return (y_starts, y_ends) arrays.
+    """
+    if total_length <= 0.0:
+        return np.empty(0), np.empty(0)
+    # every row is either forced or consumes default_height, so this caps
+    # the row count
+    n_cap = int(np.ceil(total_length / default_height)) + forced_idx.shape[0] + 2
+    h = np.full(n_cap, default_height)
+    in_range = (forced_idx >= 1) & (forced_idx <= n_cap)
+    h[forced_idx[in_range] - 1] = forced_h[in_range]
+    y_end = np.cumsum(h)
+    # rows up to and including the first edge at/past total_length
+    k = np.searchsorted(y_end, total_length, side='left') + 1
+    if k > n_cap:
+        k = n_cap
+    y_starts = np.empty(k)
+    y_starts[0] = 0.0
+    y_starts[1:] = y_end[:k - 1]
+    y_ends = y_end[:k].copy()
+    if y_ends[k - 1] > total_length:
+        y_ends[k - 1] = total_length
+    return y_starts, y_ends
+
 def build_rows(total_length, default_height, forced_heights):
     """
     From y=0 to y=<total_length>, stacking rows.
@@ -71,74 +155,177 @@ def build_rows(total_length, default_height, forced_heights):
     Stop if we exceed total_length (clamp last row).
     Return list of (row_index, y_start, y_end).
     """
-    rows = []
-    cur_y = 0.0
-    i = 1
-    while True:
-        if cur_y >= total_length:
-            break
-        forced_h = forced_heights.get(i, default_height)
-        y_end = cur_y + forced_h
-        if y_end > total_length:
-            y_end = total_length
-        rows.append((i, cur_y, y_end))
-        cur_y = y_end
-        i += 1
-        if cur_y >= total_length:
-            break
-    return rows
+    # sorted parallel arrays, pulled from the dict in two bulk reads
+    n_forced = len(forced_heights)
+    forced_idx = np.fromiter(forced_heights.keys(), dtype=np.int64,
+                             count=n_forced)
+    forced_h = np.fromiter(forced_heights.values(), dtype=np.float64,
+                           count=n_forced)
+    order = np.argsort(forced_idx)
+    forced_idx = forced_idx[order]
+    forced_h = forced_h[order]
+    y_starts, y_ends = _build_rows_impl(float(total_length),
+                                        float(default_height),
+                                        forced_idx, forced_h)
+    return [(i + 1, y_starts[i], y_ends[i]) for i in range(len(y_starts))]
 
 ###########################
-# Visualization
+# Cut-Interval Merging
 ###########################
 
-def plot_prayer_hall(ax, rows, hall_width, columns, columns_to_ignore):
+@njit(cache=True)
+def _merge_cuts(xmin, xmax, hall_width):
     """
-    Draw the layout:
-    - full row width = hall_width
-    - color rows orange if any non-ignored column intrudes.
-    - columns as red circles.
+    JIT-compiled merge: sort by xmin, keep a running max of xmax, and
+    start a new group wherever xmin jumps past the running max so far.
+    Return (merged_starts, merged_ends, leftover_starts, leftover_ends).
     """
-    def in_band(cy, ystart, yend):
-        return (cy >= ystart) and (cy < yend)
+    order = np.argsort(xmin, kind='mergesort')
+    n = xmin.shape[0]
+    merged_starts = np.empty(n)
+    merged_ends = np.empty(n)
+    m = 0
+    for k in range(n):
+        a = xmin[order[k]]
+        b = xmax[order[k]]
+        if m == 0 or a > merged_ends[m - 1]:
+            merged_starts[m] = a
+            merged_ends[m] = b
+            m += 1
+        elif b > merged_ends[m - 1]:
+            merged_ends[m - 1] = b
+    # gaps between merged groups (plus the hall edges) are the leftovers
+    leftover_starts = np.empty(m + 1)
+    leftover_ends = np.empty(m + 1)
+    t = 0
+    prev = 0.0
+    for k in range(m):
+        if merged_starts[k] > prev:
+            leftover_starts[t] = prev
+            leftover_ends[t] = merged_starts[k]
+            t += 1
+        prev = merged_ends[k]
+    if prev < hall_width:
+        leftover_starts[t] = prev
+        leftover_ends[t] = hall_width
+        t += 1
+    return merged_starts[:m], merged_ends[:m], leftover_starts[:t], leftover_ends[:t]
+
+def merge_cut_intervals(xmin, xmax, hall_width):
+    """
+    Merge overlapping cut intervals given as parallel xmin/xmax arrays
+    and compute the leftover carpet segments in [0, hall_width].
+    Return (merged, leftover) as lists of (start, end) tuples.
+    """
+    xmin = np.asarray(xmin, dtype=np.float64)
+    xmax = np.asarray(xmax, dtype=np.float64)
+    if xmin.size == 0:
+        return [], [(0.0, hall_width)] if hall_width > 0 else []
+    ms, me, ls, le = _merge_cuts(xmin, xmax, hall_width)
+    # tolist() so the tuples hold plain floats, not np.float64 scalars
+    return (list(zip(ms.tolist(), me.tolist())),
+            list(zip(ls.tolist(), le.tolist())))
 
-    # separate columns that affect custom logic
-    custom_cols = [(lbl, cx, cy, cr) for (lbl, cx, cy, cr) in columns
-                   if lbl not in columns_to_ignore]
+###########################
+# Visualization
+###########################
 
-    # Mark each row
+def assign_columns_to_rows(rows, columns, columns_to_ignore):
+    """
+    Attach each non-ignored column to the row band containing its center.
+    Rows are contiguous bands with increasing y-edges, so one searchsorted
+    over the edge array maps each column straight to its containing row --
+    no row-by-row band test needed.
+    Columns come in as the (labels, cx, cy, cr) SoA tuple from
+    parse_columns; each row gets its own SoA slice.
+    Return list of (row_index, y_start, y_end, is_custom, row_cols)
+    where row_cols is (labels, cx, cy, cr) for that row's columns.
+    """
+    labels, cx, cy, cr = columns
+    labels_arr = np.asarray(labels, dtype=object)
+    keep = ~np.isin(labels_arr, list(columns_to_ignore))
+    labels_c = list(labels_arr[keep])
+    cx_c = cx[keep]
+    cy_c = cy[keep]
+    cr_c = cr[keep]
     row_data = []
-    for (idx, ys, ye) in rows:
-        row_cols = []
-        for (lbl, cx, cy, cr) in custom_cols:
-            if in_band(cy, ys, ye):
-                row_cols.append((lbl, cx, cy, cr))
-        is_custom = bool(row_cols)
+    if rows and labels_c:
+        edges = np.array([r[1] for r in rows] + [rows[-1][2]])
+        row_for_col = np.searchsorted(edges, cy_c, side='right') - 1
+        # columns above/below the hall fall outside [0, len(rows)-1]
+        valid = (row_for_col >= 0) & (row_for_col < len(rows))
+        col_idx = np.flatnonzero(valid)
+        order = np.argsort(row_for_col[valid], kind='stable')
+        sorted_rows = row_for_col[valid][order]
+        sorted_cols = col_idx[order]
+        splits = np.searchsorted(sorted_rows, np.arange(1, len(rows)))
+        groups = np.split(sorted_cols, splits)
+    else:
+        groups = [np.empty(0, dtype=np.intp)] * len(rows)
+    for k, (idx, ys, ye) in enumerate(rows):
+        grp = groups[k]
+        row_cols = ([labels_c[j] for j in grp],
+                    cx_c[grp], cy_c[grp], cr_c[grp])
+        is_custom = len(grp) > 0
         row_data.append((idx, ys, ye, is_custom, row_cols))
+    return row_data
 
-    ax.clear()
-
-    # draw each row
+def draw_rows(ax, row_data, hall_width):
+    """
+    Draw the row rectangles as a single PatchCollection plus their labels.
+    Orange = custom (a column intrudes), green = normal.
+    Return the list of created artists.
+    """
+    rects = []
+    colors = []
+    artists = []
     for (i, ys, ye, is_custom, row_cols) in row_data:
         row_height = ye - ys
-        color = 'orange' if is_custom else 'green'
-        ax.add_patch(
-            plt.Rectangle((0, ys), hall_width, row_height,
-                          facecolor=color, alpha=0.3, edgecolor='black')
-        )
+        rects.append(Rectangle((0, ys), hall_width, row_height))
+        colors.append('orange' if is_custom else 'green')
         label_y = ys + row_height * 0.5
-        ax.text(hall_width*0.5, label_y,
-                f"R{i}\nH={row_height:.2f}m\n{'Custom' if is_custom else 'Normal'}",
-                ha='center', va='center', fontsize=8)
-
-    # draw columns
-    for (lbl, cx, cy, cr) in columns:
-        circ = plt.Circle((cx, cy), cr, color='red', alpha=0.6)
-        ax.add_patch(circ)
-        ax.text(cx, cy, lbl, color='black', fontsize=7,
-                ha='center', va='center')
-
-    # invert y-axis so front=0 is top
+        txt = ax.text(hall_width*0.5, label_y,
+                      f"R{i}\nH={row_height:.2f}m\n{'Custom' if is_custom else 'Normal'}",
+                      ha='center', va='center', fontsize=8)
+        artists.append(txt)
+    # one collection instead of one artist per rectangle
+    coll = PatchCollection(rects, facecolors=colors, alpha=0.3,
+                           edgecolor='black')
+    ax.add_collection(coll)
+    artists.insert(0, coll)
+    return artists
+
+def draw_column_circles(ax, columns):
+    """
+    Draw the columns as a single EllipseCollection.
+    Return the created artists ([] when there are no columns).
+    """
+    labels, cx, cy, cr = columns
+    if not labels:
+        return []
+    coll = EllipseCollection(widths=2*cr, heights=2*cr, angles=0,
+                             units='xy', offsets=np.c_[cx, cy],
+                             offset_transform=ax.transData,
+                             facecolors='red', alpha=0.6)
+    ax.add_collection(coll)
+    return [coll]
+
+def draw_column_labels(ax, columns):
+    """Draw one Text label per column; return the Text artists."""
+    labels, cx, cy, cr = columns
+    return [ax.text(x, y, lbl, color='black', fontsize=7,
+                    ha='center', va='center')
+            for lbl, x, y in zip(labels, cx, cy)]
+
+def draw_columns(ax, columns):
+    """
+    Draw the columns (circles + labels).
+    Return the list of created artists (needed for blitting).
+    """
+    return draw_column_circles(ax, columns) + draw_column_labels(ax, columns)
+
+def setup_axes(ax, rows, hall_width):
+    """Set limits (y inverted so front=0 is top), aspect and labels."""
     y_max = rows[-1][2] if rows else 0
     ax.set_xlim(0, hall_width)
     ax.set_ylim(y_max, 0)
@@ -147,53 +334,50 @@ def plot_prayer_hall(ax, rows, hall_width, columns, columns_to_ignore):
     ax.set_ylabel(f"Y=0 (Front) to Y={y_max:.2f} (Back)")
     ax.set_title("Prayer Hall Layout (Forcing Row Heights)")
 
-    ax.figure.canvas.draw()
-
-    # Also print a console summary
-    print("\n--- Row Summary ---")
+def plot_prayer_hall(ax, rows, hall_width, columns, columns_to_ignore):
+    """
+    Draw the layout:
+    - full row width = hall_width
+    - color rows orange if any non-ignored column intrudes.
+    - columns as red circles.
+    """
+    row_data = assign_columns_to_rows(rows, columns, columns_to_ignore)
+    ax.clear()
+    draw_rows(ax, row_data, hall_width)
+    draw_columns(ax, columns)
+    setup_axes(ax, rows, hall_width)
+    print_row_summary(row_data, hall_width)
+
+def format_row_summary(row_data, hall_width):
+    """Build the per-row summary as one string."""
+    buf = io.StringIO()
+    buf.write("\n--- Row Summary ---\n")
     for (i, ys, ye, is_custom, row_cols) in row_data:
         row_h = ye - ys
         row_type = "Custom" if is_custom else "Normal"
-        print(f"\nRow {i}: y=[{ys:.2f},{ye:.2f}], height={row_h:.2f}, {row_type}")
+        buf.write(f"\nRow {i}: y=[{ys:.2f},{ye:.2f}], height={row_h:.2f}, {row_type}\n")
         if not is_custom:
-            print(f" => Normal row => {hall_width:.2f}m x {row_h:.2f}m")
+            buf.write(f" => Normal row => {hall_width:.2f}m x {row_h:.2f}m\n")
         else:
-            # compute horizontal cut intervals
-            cuts = []
-            for (lbl, cx, cy, cr) in row_cols:
-                x_min = cx - cr
-                x_max = cx + cr
-                # clamp
-                if x_min < 0: x_min = 0
-                if x_max > hall_width: x_max = hall_width
-                if x_max > x_min:
-                    cuts.append((x_min, x_max))
-            cuts.sort(key=lambda x: x[0])
-            merged = []
-            for iv in cuts:
-                if not merged:
-                    merged.append(iv)
-                else:
-                    prev = merged[-1]
-                    if iv[0] <= prev[1]:
-                        merged[-1] = (prev[0], max(prev[1], iv[1]))
-                    else:
-                        merged.append(iv)
-            # leftover segments
-            leftover = []
-            start_x = 0.0
-            for (cstart, cend) in merged:
-                if cstart > start_x:
-                    leftover.append((start_x, cstart))
-                start_x = cend
-            if start_x < hall_width:
-                leftover.append((start_x, hall_width))
-            print(f" => Columns: {[c[0] for c in row_cols]}")
-            print(f" => Full row: {hall_width:.2f} x {row_h:.2f}, cut intervals: {merged}")
+            # compute horizontal cut intervals: clamp all columns at once
+            lbls_r, cx_r, cy_r, cr_r = row_cols
+            xmin = np.clip(cx_r - cr_r, 0.0, hall_width)
+            xmax = np.clip(cx_r + cr_r, 0.0, hall_width)
+            keep = xmax > xmin
+            merged, leftover = merge_cut_intervals(xmin[keep], xmax[keep],
+                                                   hall_width)
+            buf.write(f" => Columns: {lbls_r}\n")
+            buf.write(f" => Full row: {hall_width:.2f} x {row_h:.2f}, cut intervals: {merged}\n")
             if leftover:
                 for seg in leftover:
                     sw = seg[1] - seg[0]
-                    print(f"    leftover x=[{seg[0]:.2f},{seg[1]:.2f}] => width={sw:.2f}m")
+                    buf.write(f"    leftover x=[{seg[0]:.2f},{seg[1]:.2f}] => width={sw:.2f}m\n")
+    return buf.getvalue()
+
+def print_row_summary(row_data, hall_width):
+    """Print the per-row console summary (only when _DEBUG is on)."""
+    if _DEBUG:
+        print(format_row_summary(row_data, hall_width), end="")
 
 ############################
 # The GUI App
@@ -262,6 +446,85 @@ class ForcedHeightGUI(tk.Tk):
         self.toolbar.update()
         self.canvas_widget.pack(side=tk.TOP, fill=tk.BOTH, expand=True)
 
+        # blitting state: cached row background + the column artists
+        # drawn on top of it
+        self._bg = None
+        self._row_key = None
+        self._axis_key = None
+        self._col_circles = []
+        self._col_texts = []
+        self._row_artists = []
+        # coalesce rapid clicks into a single deferred render
+        self._redraw_pending = False
+        # reuse rows/columns when the inputs that produce them are unchanged
+        self._rows_cache = {}
+        self._cols_cache = None
+        self._forced_cache = None
+        # columns that never count toward marking a row custom
+        self._ignore = frozenset({"C1"})
+        self.canvas.mpl_connect('draw_event', self._on_draw)
+
+    def _on_draw(self, event):
+        # a full render just finished (button press, resize, pan/zoom):
+        # recapture the row background, then take the fast path for the
+        # columns -- the handler itself never triggers another full render
+        self._redraw_pending = False
+        self._bg = self.canvas.copy_from_bbox(self.ax.bbox)
+        self._render_columns()
+
+    def _render_columns(self):
+        """
+        Fast partial update: paint the animated column artists over the
+        cached row background and push only the axes bbox to Tk instead
+        of re-uploading the whole figure.
+        """
+        self.canvas.restore_region(self._bg)
+        for artist in self._col_circles + self._col_texts:
+            self.ax.draw_artist(artist)
+        self.canvas.blit(self.ax.bbox)
+
+    def _refresh_col_artists(self, columns):
+        """
+        Swap in a fresh circle collection (a single cheap artist) but
+        reuse the cached label Text artists, just moving and retitling
+        them so their layout setup isn't repeated every plot.
+        """
+        labels, cx, cy, cr = columns
+        for circ in self._col_circles:
+            circ.remove()
+        self._col_circles = draw_column_circles(self.ax, columns)
+        if len(self._col_texts) == len(labels):
+            for txt, lbl, x, y in zip(self._col_texts, labels, cx, cy):
+                txt.set_text(lbl)
+                txt.set_position((x, y))
+        else:
+            for txt in self._col_texts:
+                txt.remove()
+            self._col_texts = draw_column_labels(self.ax, columns)
+        for artist in self._col_circles + self._col_texts:
+            artist.set_animated(True)
+
+    def _update_row_artists(self, row_data, hall_width):
+        """
+        Update the cached row collection and labels in place instead of
+        tearing the axes down with ax.clear().
+        Return False when the row count changed and a rebuild is needed.
+        """
+        if not self._row_artists or len(self._row_artists) - 1 != len(row_data):
+            return False
+        coll = self._row_artists[0]
+        coll.set_paths([Rectangle((0, ys), hall_width, ye - ys)
+                        for (_, ys, ye, _, _) in row_data])
+        coll.set_facecolors(['orange' if is_custom else 'green'
+                             for (_, _, _, is_custom, _) in row_data])
+        for txt, (i, ys, ye, is_custom, _) in zip(self._row_artists[1:],
+                                                  row_data):
+            row_height = ye - ys
+            txt.set_position((hall_width*0.5, ys + row_height*0.5))
+            txt.set_text(f"R{i}\nH={row_height:.2f}m\n"
+                         f"{'Custom' if is_custom else 'Normal'}")
+        return True
+
     def on_plot(self):
         try:
             # get user input
@@ -269,23 +532,66 @@ class ForcedHeightGUI(tk.Tk):
             W = float(self.width_var.get())
             def_h = float(self.def_h_var.get())
 
-            forced_str = self.forced_text.get("1.0", "end")
-            forced_heights = parse_forced_rows(forced_str)
-
-            col_str = self.col_text.get("1.0", "end")
-            columns = parse_columns(col_str)
-
-            # build rows
-            rows = build_rows(L, def_h, forced_heights)
-
-            # ignore C1 in marking custom
-            columns_to_ignore = {"C1"}
-
-            # plot
-            plot_prayer_hall(self.ax, rows, W, columns, columns_to_ignore)
-
-            self.canvas.draw()
-            self.toolbar.update()
+            # re-parse a text box only when Tk says it was edited
+            if (self._forced_cache is not None
+                    and not self.forced_text.edit_modified()):
+                forced_heights = self._forced_cache
+            else:
+                forced_heights = parse_forced_rows(
+                    self.forced_text.get("1.0", "end"))
+                self._forced_cache = forced_heights
+                self.forced_text.edit_modified(False)
+
+            if (self._cols_cache is not None
+                    and not self.col_text.edit_modified()):
+                columns = self._cols_cache
+            else:
+                columns = parse_columns(self.col_text.get("1.0", "end"))
+                self._cols_cache = columns
+                self.col_text.edit_modified(False)
+
+            # build rows (cached per parameter set)
+            rows_key = (L, def_h, tuple(sorted(forced_heights.items())))
+            rows = self._rows_cache.get(rows_key)
+            if rows is None:
+                rows = build_rows(L, def_h, forced_heights)
+                self._rows_cache[rows_key] = rows
+
+            row_data = assign_columns_to_rows(rows, columns, self._ignore)
+
+            # rows (and their colors) only change when geometry or the
+            # custom flags change; otherwise just re-blit the columns
+            # over the cached background
+            row_key = (W, tuple((i, ys, ye, is_custom)
+                                for (i, ys, ye, is_custom, _) in row_data))
+            if row_key == self._row_key and self._bg is not None:
+                self._refresh_col_artists(columns)
+                self._render_columns()
+            else:
+                # full redraw: the columns are animated so the deferred
+                # render leaves them out of the background; _on_draw then
+                # captures the row-only background and blits them on top
+                y_max = rows[-1][2] if rows else 0
+                axis_key = (W, y_max)
+                if not (axis_key == self._axis_key
+                        and self._update_row_artists(row_data, W)):
+                    # ax.clear() detaches every cached artist
+                    self.ax.clear()
+                    self._col_circles = []
+                    self._col_texts = []
+                    self._row_artists = draw_rows(self.ax, row_data, W)
+                    setup_axes(self.ax, rows, W)
+                self._refresh_col_artists(columns)
+                self._row_key = row_key
+                if not self._redraw_pending:
+                    self._redraw_pending = True
+                    self.canvas.draw_idle()
+                # toolbar only needs updating when the limits moved
+                if axis_key != self._axis_key:
+                    self.toolbar.update()
+                    self._axis_key = axis_key
+
+            print_row_summary(row_data, W)
 
         except Exception as e:
             messagebox.showerror("Error", f"Failed to plot:\n{e}")